@@ -2,6 +2,7 @@ from bluesky.callbacks.core import CallbackBase
 import numpy as np
 import ast
 import time
+from functools import lru_cache
 import scipy.constants as const
 
 # Record the start time of the script
@@ -187,6 +188,26 @@ class Evaluator(CallbackBase):
         return self.last_update == t
 
 
+@lru_cache(maxsize=1024)
+def _compile_expression(eval_str: str):
+    """
+    Compiles the given string as a Python expression. The result is cached, so
+    strings that are evaluated repeatedly (e.g. watchdog conditions or plot
+    formulas) are only parsed once.
+
+    Parameters
+    ----------
+    eval_str : str
+        The expression to be compiled.
+
+    Returns
+    -------
+    code
+        The compiled code object, to be used with `eval`.
+    """
+    return compile(eval_str, "<string>", "eval")
+
+
 def get_eval(eval_str: str, namespace: dict, evaluator: "Evaluator" = None):
     """
     Evaluates the given string within the given namespace. Most functionality is
@@ -223,19 +244,24 @@ def get_eval(eval_str: str, namespace: dict, evaluator: "Evaluator" = None):
         pass
     # Check whether it is valid Python syntax.
     try:
-        ast.parse(eval_str)
-    except SyntaxError as err:
-        error_text = f"Could not find {eval_str!r} in namespace or evaluate it."
-        if evaluator and error_text in evaluator.raised_exceptions:
-            return np.nan
-        if evaluator is not None:
-            evaluator.raised_exceptions.append(error_text)
-        raise ValueError(
-            f"Could not find {eval_str!r} in namespace or parse it as a Python expression."
-        ) from err
+        code = _compile_expression(eval_str)
+    except SyntaxError:
+        # Statements are valid syntax but no expressions, they fail in eval below.
+        code = eval_str
+        try:
+            ast.parse(eval_str)
+        except SyntaxError as err:
+            error_text = f"Could not find {eval_str!r} in namespace or evaluate it."
+            if evaluator and error_text in evaluator.raised_exceptions:
+                return np.nan
+            if evaluator is not None:
+                evaluator.raised_exceptions.append(error_text)
+            raise ValueError(
+                f"Could not find {eval_str!r} in namespace or parse it as a Python expression."
+            ) from err
     # Try to evaluate it as a Python expression in the namespace.
     try:
-        return eval(eval_str, namespace)
+        return eval(code, namespace)
     except Exception as err:
         error_text = f"Could not find {eval_str!r} in namespace or evaluate it."
         if evaluator is not None:
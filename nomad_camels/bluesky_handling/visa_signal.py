@@ -37,6 +37,12 @@ except OSError:
     rm = pyvisa.ResourceManager("@py")
 open_resources = {}
 
+# class names that may be given as `parse_return_type`
+_return_types = {"str": str, "float": float, "int": int, "bool": bool}
+
+# matches fixed-point format fields like "{value:.3f}" in a write string
+_fixed_point_format = re.compile(r"{value:\.\df}")
+
 
 def list_resources():
     """Gives the results of `ResourceManager.list_resources`."""
@@ -119,16 +125,9 @@ class VISA_Signal(Signal):
         self.parse = parse
         self.retry_on_error = retry_on_error
         self.retry_on_timeout = retry_on_timeout
-        if parse_return_type == "str":
-            self.parse_return_type = str
-        elif parse_return_type == "float":
-            self.parse_return_type = float
-        elif parse_return_type == "int":
-            self.parse_return_type = int
-        elif parse_return_type == "bool":
-            self.parse_return_type = bool
-        else:
-            self.parse_return_type = parse_return_type
+        self.parse_return_type = _return_types.get(
+            parse_return_type, parse_return_type
+        )
 
     def change_instrument(self, resource_name):
         """
@@ -159,7 +158,7 @@ class VISA_Signal(Signal):
             val = value
             if "value:g" in self.write:
                 val = float(value)
-            elif re.search(r"{value:\.\df}", self.write) is not None:
+            elif _fixed_point_format.search(self.write) is not None:
                 val = float(value)
             elif "value:d" in self.write:
                 val = int(value)
@@ -183,7 +182,7 @@ class VISA_Signal(Signal):
                 except Exception as e:
                     import logging
 
-                    logging.warning(f"Error parsing value: {val}, Exception: {e}")
+                    logging.warning("Error parsing value: %s, Exception: %s", val, e)
             if self.parse_return_type:
                 try:
                     value = self.parse_return_type(val)
@@ -325,16 +324,9 @@ class VISA_Signal_RO(SignalRO):
         self.write_delay = write_delay
         self.retry_on_error = retry_on_error
         self.retry_on_timeout = retry_on_timeout
-        if parse_return_type == "str":
-            self.parse_return_type = str
-        elif parse_return_type == "float":
-            self.parse_return_type = float
-        elif parse_return_type == "int":
-            self.parse_return_type = int
-        elif parse_return_type == "bool":
-            self.parse_return_type = bool
-        else:
-            self.parse_return_type = parse_return_type
+        self.parse_return_type = _return_types.get(
+            parse_return_type, parse_return_type
+        )
 
     def get(self):
         """
@@ -363,7 +355,7 @@ class VISA_Signal_RO(SignalRO):
             except Exception as e:
                 import logging
 
-                logging.warning(f"Error parsing value: {val}, Exception: {e}")
+                logging.warning("Error parsing value: %s, Exception: %s", val, e)
         if self.parse_return_type:
             try:
                 val = self.parse_return_type(val)
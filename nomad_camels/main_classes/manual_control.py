@@ -8,13 +8,17 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 from PySide6.QtGui import QIcon, QCloseEvent
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QThread
 
 from nomad_camels.utility import device_handling, variables_handling
 
 from importlib import resources
 from nomad_camels import graphics
 
+import math
+import threading
+import time
+
 
 class Manual_Control(QWidget):
     """
@@ -137,6 +141,108 @@ class Manual_Control(QWidget):
         self.setEnabled(True)
 
 
+class Readback_Thread_Base(QThread):
+    """
+    Parent class for the readback threads of manual controls.
+
+    It provides `still_running` and `read_time` as well as waiting between two
+    readings via `wait_read_time`. Setting `still_running` to False or changing
+    `read_time` wakes up a waiting thread, so it stops right away and uses a new
+    read time without having to be restarted.
+
+    Parameters
+    ----------
+    parent : QObject
+        The parent of the thread.
+    read_time : float
+        The time in seconds between two readings. `inf` means that the thread
+        only waits until it is stopped or a finite read time is set.
+    """
+
+    def __init__(self, parent=None, read_time=5):
+        super().__init__(parent=parent)
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._read_time = read_time
+
+    @property
+    def still_running(self):
+        """Whether the thread should keep reading."""
+        return not self._stopped
+
+    @still_running.setter
+    def still_running(self, value):
+        with self._condition:
+            self._stopped = not value
+            self._condition.notify_all()
+
+    @property
+    def read_time(self):
+        """The time in seconds between two readings."""
+        return self._read_time
+
+    @read_time.setter
+    def read_time(self, value):
+        with self._condition:
+            self._read_time = value
+            self._condition.notify_all()
+
+    def wait_read_time(self):
+        """
+        Waits until `read_time` has passed since the call or until the thread
+        is stopped. A change of `read_time` during the wait is taken into
+        account.
+
+        Returns
+        -------
+        bool
+            True if the thread was stopped, False if it should read again.
+
+        Raises
+        ------
+        ValueError
+            If `read_time` is negative or NaN.
+        """
+        start = time.monotonic()
+        with self._condition:
+            while not self._stopped:
+                timeout = get_read_timeout(self._read_time)
+                if timeout is not None:
+                    timeout -= time.monotonic() - start
+                    if timeout <= 0:
+                        break
+                self._condition.wait(timeout)
+            return self._stopped
+
+
+def get_read_timeout(read_time):
+    """
+    Checks the read time of a readback thread and converts it to a timeout for
+    waiting.
+
+    Parameters
+    ----------
+    read_time : float
+        The time in seconds between two readings.
+
+    Returns
+    -------
+    float, None
+        `read_time` itself, or None if it is infinite, i.e. wait without
+        timeout.
+
+    Raises
+    ------
+    ValueError
+        If `read_time` is negative or NaN.
+    """
+    if math.isnan(read_time) or read_time < 0:
+        raise ValueError(f"Invalid read time: {read_time}")
+    if math.isinf(read_time):
+        return None
+    return read_time
+
+
 class Manual_Control_Config(QDialog):
     """ """
 
@@ -14,18 +14,17 @@ from PySide6.QtWidgets import (
     QSpacerItem,
     QSizePolicy,
 )
-from PySide6.QtCore import Signal, QThread
+from PySide6.QtCore import Signal
 from PySide6.QtGui import QFont
 
 from nomad_camels.main_classes.manual_control import (
     Manual_Control,
     Manual_Control_Config,
+    Readback_Thread_Base,
 )
 from nomad_camels.ui_widgets.channels_check_table import Channels_Check_Table
 from nomad_camels.utility import device_handling, variables_handling
 
-import time
-
 bold_font = QFont()
 bold_font.setBold(True)
 
@@ -190,40 +189,32 @@ def conv_value(value):
     return value
 
 
-class Readback_Thread(QThread):
+class Readback_Thread(Readback_Thread_Base):
     data_sig = Signal(dict)
     exception_signal = Signal(Exception)
 
     def __init__(self, parent=None, channels=None, read_time=5):
-        super().__init__(parent=parent)
-        self.channels = channels or []
-        self.read_time = read_time
-        self.still_running = True
+        super().__init__(parent=parent, read_time=read_time)
+        self.channels = channels or {}
+        # resolve the trigger methods once instead of checking on every read
+        self._triggers = [
+            channel.trigger
+            for channel in self.channels.values()
+            if hasattr(channel, "trigger")
+        ]
 
     def run(self):
         try:
             self.do_reading()
-            accum = 0
-            while self.still_running:
-                if self.read_time > 5:
-                    if self.read_time - accum > 5:
-                        time.sleep(5)
-                        accum += 5
-                        continue
-                    else:
-                        time.sleep(self.read_time - accum)
-                        accum = 0
-                else:
-                    time.sleep(self.read_time)
+            while not self.wait_read_time():
                 self.do_reading()
         except Exception as e:
             self.exception_signal.emit(e)
 
     def do_reading(self):
         vals = {}
-        for channel in self.channels.values():
-            if hasattr(channel, "trigger"):
-                channel.trigger()
+        for trigger in self._triggers:
+            trigger()
         for name, channel in self.channels.items():
             vals[name] = channel.get()
         self.data_sig.emit(vals)
@@ -7,6 +7,7 @@ from PySide6.QtGui import QKeyEvent
 from nomad_camels.main_classes.manual_control import (
     Manual_Control,
     Manual_Control_Config,
+    Readback_Thread_Base,
 )
 from nomad_camels.utility import variables_handling, device_handling, number_formatting
 
@@ -638,47 +639,39 @@ class Move_Thread(QThread):
         self.moving_started[ax] = True
 
 
-class Readback_Thread(QThread):
+class Readback_Thread(Readback_Thread_Base):
     """ """
 
     data_sig = Signal(float, float, float)
     exception_signal = Signal(Exception)
 
     def __init__(self, parent=None, channels=None, read_time=np.inf):
-        super().__init__(parent=parent)
+        super().__init__(parent=parent, read_time=read_time)
         self.channels = channels or []
-        self.read_time = read_time
-        self.still_running = True
         self.paused = False
+        # resolve the trigger methods once instead of checking on every read
+        self._triggers = [
+            channel.trigger
+            for channel in self.channels
+            if channel and hasattr(channel, "trigger")
+        ]
 
     def run(self):
         """ """
         try:
-            accum = 0
             while self.still_running:
-                if self.paused:
-                    time.sleep(self.read_time)
-                    continue
-                self.do_reading()
-                if self.read_time > 5:
-                    if self.read_time - accum > 5:
-                        time.sleep(5)
-                        accum += 5
-                        continue
-                    else:
-                        time.sleep(self.read_time - accum)
-                        accum = 0
-                else:
-                    time.sleep(self.read_time)
+                if not self.paused:
+                    self.do_reading()
+                if self.wait_read_time():
+                    break
         except Exception as e:
             self.exception_signal.emit(e)
 
     def do_reading(self):
         """ """
         vals = []
-        for channel in self.channels:
-            if channel and hasattr(channel, "trigger"):
-                channel.trigger()
+        for trigger in self._triggers:
+            trigger()
         for channel in self.channels:
             if channel:
                 vals.append(channel.get())
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from nomad_camels.bluesky_handling.evaluation_helper import (
+    Evaluator,
+    _compile_expression,
+    get_eval,
+)
+
+
+def test_get_eval_namespace_and_expression():
+    namespace = {"a": 2, "name with spaces": 5}
+    assert get_eval("name with spaces", namespace) == 5
+    assert get_eval(" a * 3 ", namespace) == 6
+    assert get_eval(1.5, namespace) == 1.5
+
+
+def test_get_eval_compiles_once():
+    _compile_expression.cache_clear()
+    namespace = {"a": 1}
+    for a in range(5):
+        namespace["a"] = a
+        assert get_eval("a < 3", namespace) == (a < 3)
+    info = _compile_expression.cache_info()
+    assert info.misses == 1
+    assert info.hits == 4
+
+
+def test_get_eval_syntax_error():
+    with pytest.raises(ValueError, match="parse it as a Python expression"):
+        get_eval("a <", {"a": 1})
+
+
+def test_get_eval_statement_is_evaluation_error():
+    # statements are valid syntax, but cannot be evaluated
+    with pytest.raises(ValueError, match="or evaluate it"):
+        get_eval("a = 1", {"a": 1})
+
+
+def test_get_eval_unknown_name():
+    with pytest.raises(ValueError, match="or evaluate it"):
+        get_eval("b + 1", {"a": 1})
+
+
+@pytest.mark.parametrize("eval_str", ["a <", "a = 1", "b + 1"])
+def test_evaluator_reports_error_once(eval_str):
+    eva = Evaluator(namespace={"a": 1})
+    with pytest.raises(ValueError):
+        eva.eval(eval_str, do_not_reraise=True)
+    assert len(eva.raised_exceptions) == 1
+    assert np.isnan(eva.eval(eval_str, do_not_reraise=True))
+    assert len(eva.raised_exceptions) == 1
@@ -0,0 +1,80 @@
+import time
+
+import numpy as np
+
+from nomad_camels.manual_controls.set_panel.set_panel import (
+    Readback_Thread as Set_Panel_Readback_Thread,
+)
+from nomad_camels.manual_controls.stage_control.stage_control import (
+    Readback_Thread as Stage_Readback_Thread,
+)
+
+
+class Counting_Channel:
+    """Stands in for an ophyd channel and counts how often it is read."""
+
+    def __init__(self):
+        self.reads = 0
+        self.triggers = 0
+
+    def trigger(self):
+        self.triggers += 1
+
+    def get(self):
+        self.reads += 1
+        return float(self.reads)
+
+
+def stop_thread(thread):
+    thread.still_running = False
+    assert thread.wait(1000)
+
+
+def test_stage_readback_stops_promptly(qtbot):
+    channel = Counting_Channel()
+    thread = Stage_Readback_Thread(channels=[channel, None, None], read_time=100)
+    thread.start()
+    qtbot.waitUntil(lambda: channel.reads == 1, timeout=5000)
+    start = time.monotonic()
+    stop_thread(thread)
+    assert time.monotonic() - start < 1
+    assert channel.reads == 1
+    assert channel.triggers == 1
+
+
+def test_stage_readback_picks_up_read_time(qtbot):
+    channel = Counting_Channel()
+    thread = Stage_Readback_Thread(channels=[channel, None, None], read_time=np.inf)
+    thread.start()
+    qtbot.waitUntil(lambda: channel.reads == 1, timeout=5000)
+    # an infinite read time only reads once until a finite one is set
+    thread.read_time = 0.01
+    qtbot.waitUntil(lambda: channel.reads >= 3, timeout=5000)
+    thread.read_time = 100
+    qtbot.wait(100)
+    reads = channel.reads
+    qtbot.wait(300)
+    assert channel.reads == reads
+    stop_thread(thread)
+
+
+def test_set_panel_readback_infinite_read_time(qtbot):
+    channel = Counting_Channel()
+    thread = Set_Panel_Readback_Thread(channels={"chan": channel}, read_time=np.inf)
+    errors = []
+    thread.exception_signal.connect(errors.append)
+    thread.start()
+    qtbot.waitUntil(lambda: channel.reads == 1, timeout=5000)
+    stop_thread(thread)
+    assert not errors
+
+
+def test_readback_invalid_read_time(qtbot):
+    for thread in (
+        Stage_Readback_Thread(channels=[Counting_Channel(), None, None], read_time=-1),
+        Set_Panel_Readback_Thread(channels={"chan": Counting_Channel()}, read_time=-1),
+    ):
+        with qtbot.waitSignal(thread.exception_signal, timeout=5000) as blocker:
+            thread.start()
+        assert isinstance(blocker.args[0], ValueError)
+        assert thread.wait(1000)
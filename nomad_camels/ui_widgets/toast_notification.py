@@ -32,6 +32,8 @@ from PySide6.QtCore import (
 )
 from PySide6.QtGui import QIcon
 
+logger = logging.getLogger(__name__)
+
 
 class ToastType(Enum):
     """Enumeration for different types of toast notifications."""
@@ -550,8 +552,7 @@ class ToastManager(QObject):
 
     def _remove_toast(self, toast_id: int):
         """Remove a toast from the active list."""
-        if toast_id in self.active_toasts:
-            del self.active_toasts[toast_id]
+        self.active_toasts.pop(toast_id, None)
 
     def dismiss_all(self):
         """Dismiss all active toast notifications."""
@@ -596,7 +597,6 @@ class EnhancedErrorHandler:
         """
         self.toast_manager = toast_manager
         self.parent = parent
-        self.logger = logging.getLogger(__name__)
 
     def handle_validation_error(
         self,
@@ -618,7 +618,7 @@ class EnhancedErrorHandler:
             False to indicate validation failure
         """
         if log_error:
-            self.logger.warning(f"Validation error: {error_message}")
+            logger.warning("Validation error: %s", error_message)
 
         # Show toast notification
         self.toast_manager.show_toast(
@@ -654,7 +654,7 @@ class EnhancedErrorHandler:
         title = "Error"
 
         if log_error:
-            self.logger.error(f"Error in {context}: {error_message}", exc_info=True)
+            logger.error("Error in %s: %s", context, error_message, exc_info=True)
 
         # Show toast notification
         self.toast_manager.show_toast(